@@ -60,6 +60,7 @@ class Mesh(object):
         self.lons = lons
         self.lats = lats
         self.depths = depths
+        self._trig_cache = None
 
     @classmethod
     def from_points_list(cls, points):
@@ -143,6 +144,28 @@ class Mesh(object):
         """
         return self.lons.size
 
+    def _get_trig_cache(self):
+        """
+        Get mesh points' coordinates in radians along with cosines
+        of their latitudes, as needed for calculating geodetic distances.
+
+        Values are calculated on the first call and cached, so that
+        distances from many points to the same mesh can be calculated
+        without redoing it (see
+        :meth:`openquake.hazardlib.geo.point.Point.closer_than`).
+        Coordinates arrays of the mesh are not supposed to be modified
+        after that.
+
+        :returns:
+            Tuple of three numpy arrays of the same shape as the mesh:
+            longitudes and latitudes in radians and cosines of latitudes.
+        """
+        if self._trig_cache is None:
+            lons = numpy.radians(self.lons)
+            lats = numpy.radians(self.lats)
+            self._trig_cache = (lons, lats, numpy.cos(lats))
+        return self._trig_cache
+
     def get_min_distance(self, mesh):
         """
         Compute and return the minimum distance from the mesh to each point
@@ -16,6 +16,8 @@
 """
 Module :mod:`openquake.hazardlib.geo.point` defines :class:`Point`.
 """
+import math
+
 import numpy
 import shapely.geometry
 
@@ -93,9 +95,25 @@ class Point(object):
         :rtype:
             Instance of :class:`Point`
         """
-        lon, lat = geodetic.point_at(self.longitude, self.latitude,
-                                     azimuth, horizontal_distance)
-        return Point(lon, lat, self.depth + vertical_increment)
+        # this is the same formula as in geodetic.point_at(), but applied
+        # to a single point. scalar functions from the math module are
+        # several times faster than numpy ones called on scalars.
+        lon, lat = math.radians(self.longitude), math.radians(self.latitude)
+        tc = math.radians(360 - azimuth)
+        sin_dist = math.sin(horizontal_distance / geodetic.EARTH_RADIUS)
+        cos_dist = math.cos(horizontal_distance / geodetic.EARTH_RADIUS)
+        sin_lat = math.sin(lat)
+        cos_lat = math.cos(lat)
+
+        sin_lat2 = sin_lat * cos_dist + cos_lat * sin_dist * math.cos(tc)
+        sin_lat2 = min(max(sin_lat2, -1.), 1.)
+        lat2 = math.degrees(math.asin(sin_lat2))
+
+        dlon = math.atan2(math.sin(tc) * sin_dist * cos_lat,
+                          cos_dist - sin_lat * sin_lat2)
+        lon2 = math.degrees((lon - dlon + math.pi) % (2 * math.pi) - math.pi)
+
+        return Point(lon2, lat2, self.depth + vertical_increment)
 
     def azimuth(self, point):
         """
@@ -272,15 +290,27 @@ class Point(object):
         :returns:
             Numpy array of boolean values in the same shape as the mesh
             coordinate arrays with ``True`` on indexes of points that
-            are not further than ``radius`` km from this point. Function
-            :func:`~openquake.hazardlib.geo.geodetic.distance` is used to
-            calculate distances to points of the mesh. Points of the mesh that
-            lie exactly ``radius`` km away from this point also have
-            ``True`` in their indices.
+            are not further than ``radius`` km from this point. Distances
+            to points of the mesh are calculated the same way as in
+            :func:`~openquake.hazardlib.geo.geodetic.distance`. Points
+            of the mesh that lie exactly ``radius`` km away from this point
+            also have ``True`` in their indices.
+
+        Mesh coordinates in radians and cosines of mesh latitudes are taken
+        from the mesh's cache, so checking proximity of many points to
+        the same mesh (like when filtering the same site collection
+        by distance to many sources and ruptures) doesn't recalculate them.
         """
-        dists = geodetic.distance(self.longitude, self.latitude, self.depth,
-                                  mesh.lons, mesh.lats,
-                                  0 if mesh.depths is None else mesh.depths)
+        mlons, mlats, cos_mlats = mesh._get_trig_cache()
+        lon, lat = math.radians(self.longitude), math.radians(self.latitude)
+        # next five lines are the same as in geodetic.geodetic_distance()
+        hdists = numpy.arcsin(numpy.sqrt(
+            numpy.sin((lat - mlats) / 2.0) ** 2.0
+            + math.cos(lat) * cos_mlats
+            * numpy.sin((lon - mlons) / 2.0) ** 2.0
+        ).clip(-1., 1.)) * (2.0 * geodetic.EARTH_RADIUS)
+        vdists = self.depth - (0 if mesh.depths is None else mesh.depths)
+        dists = numpy.sqrt(hdists ** 2 + vdists ** 2)
         return dists <= radius
 
     @classmethod
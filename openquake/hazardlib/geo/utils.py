@@ -32,8 +32,25 @@ def clean_points(points):
     if not points:
         return points
 
-    result = [points[0]]
-    for point in points:
+    # find the distances between all the adjacent points at once. if none
+    # of them is small enough for points to be considered equal, there is
+    # nothing to remove
+    lons, lats, depths = numpy.array(
+        [(point.longitude, point.latitude, point.depth) for point in points],
+        dtype=float
+    ).transpose()
+    dists = geodetic.distance(lons[:-1], lats[:-1], depths[:-1],
+                              lons[1:], lats[1:], depths[1:])
+    [duplicates] = numpy.nonzero(dists <= points[0].EQUALITY_DISTANCE)
+    if not len(duplicates):
+        return list(points)
+
+    # points up to the first duplicate are all kept, the rest need
+    # to be compared with the last point kept, which is not necessarily
+    # the adjacent one
+    first_duplicate = duplicates[0] + 1
+    result = list(points[:first_duplicate])
+    for point in points[first_duplicate:]:
         if point != result[-1]:
             result.append(point)
     return result
@@ -67,12 +84,15 @@ def line_intersects_itself(lons, lats, closed_shape=False):
     proj = get_orthographic_projection(west, east, north, south)
 
     xx, yy = proj(lons, lats)
-    if not shapely.geometry.LineString(zip(xx, yy)).is_simple:
+    coords = numpy.column_stack((xx, yy))
+    if not shapely.geometry.LineString(coords).is_simple:
         return True
 
     if closed_shape:
-        xx, yy = proj(numpy.roll(lons, 1), numpy.roll(lats, 1))
-        if not shapely.geometry.LineString(zip(xx, yy)).is_simple:
+        # projection is applied point by point, so shifting the projected
+        # coordinates is the same as projecting the shifted points
+        coords = numpy.roll(coords, 1, axis=0)
+        if not shapely.geometry.LineString(coords).is_simple:
             return True
 
     return False
@@ -81,13 +101,16 @@ def line_intersects_itself(lons, lats, closed_shape=False):
 def get_longitudinal_extent(lon1, lon2):
     """
     Return the distance between two longitude values as an angular measure.
-    Parameters represent two longitude values in degrees.
+    Parameters represent two longitude values in degrees. They could be
+    scalar float numbers or numpy arrays, in which case they should
+    "broadcast together".
 
     :return:
         Float, the angle between ``lon1`` and ``lon2`` in degrees. Value
         is positive if ``lon2`` is on the east from ``lon1`` and negative
         otherwise. Absolute value of the result doesn't exceed 180 for
-        valid parameters values.
+        valid parameters values. If parameters are numpy arrays, the result
+        is an array of such angles.
     """
     return (lon2 - lon1 + 180) % 360 - 180
 
@@ -109,6 +132,7 @@ def get_spherical_bounding_box(lons, lats):
         180 degrees (it is impossible to define a single hemisphere
         bound to poles that would contain the whole collection).
     """
+    lons = numpy.asarray(lons)
     north, south = numpy.max(lats), numpy.min(lats)
     west, east = numpy.min(lons), numpy.max(lons)
     assert (-180 <= west <= 180) and (-180 <= east <= 180)
@@ -116,11 +140,10 @@ def get_spherical_bounding_box(lons, lats):
         # points are lying on both sides of the international date line
         # (meridian 180). the actual west longitude is the lowest positive
         # longitude and east one is the highest negative.
-        west = min(lon for lon in lons if lon > 0)
-        east = max(lon for lon in lons if lon < 0)
-        if not all((get_longitudinal_extent(west, lon) >= 0
-                    and get_longitudinal_extent(lon, east) >= 0)
-                   for lon in lons):
+        west = numpy.min(lons[lons > 0])
+        east = numpy.max(lons[lons < 0])
+        if not ((get_longitudinal_extent(west, lons) >= 0)
+                & (get_longitudinal_extent(lons, east) >= 0)).all():
             raise ValueError('points collection has longitudinal extent '
                              'wider than 180 deg')
     return west, east, north, south
@@ -186,7 +209,7 @@ def get_orthographic_projection(west, east, north, south):
                 raise ValueError('some points are too far from the projection '
                                  'center lon=%s lat=%s' %
                                  (numpy.degrees(lambda0), numpy.degrees(phi0)))
-            xx = numpy.cos(phis) * numpy.sin(lambdas)
+            xx = cos_phis * numpy.sin(lambdas)
             yy = (cos_phi0 * numpy.sin(phis) - sin_phi0 * cos_phis
                   * numpy.cos(lambdas))
             return xx * EARTH_RADIUS, yy * EARTH_RADIUS
@@ -92,3 +92,20 @@ class BaseMFD(object):
         :return:
             Magnitude value, float number.
         """
+
+    def get_min_max_mag(self):
+        """
+        Return the minimum and maximum magnitudes this MFD produces
+        events for.
+
+        Default implementation calculates the whole histogram. Subclasses
+        are encouraged to override it with a cheaper one.
+
+        :return:
+            A tuple of two items: the first and the last bin centers
+            of the histogram returned by :meth:`get_annual_occurrence_rates`
+            having non-zero occurrence rate.
+        """
+        mags = [mag for (mag, occ_rate) in self.get_annual_occurrence_rates()
+                if occ_rate > 0]
+        return mags[0], mags[-1]
@@ -79,3 +79,13 @@ class EvenlyDiscretizedMFD(BaseMFD):
         Returns the ``min_mag`` parameter.
         """
         return self.min_mag
+
+    def get_min_max_mag(self):
+        """
+        Returns the centers of the first and the last bins having
+        non-zero occurrence rate.
+        """
+        nonzero = [i for i, occurrence_rate in enumerate(self.occurrence_rates)
+                   if occurrence_rate > 0]
+        return (self.min_mag + nonzero[0] * self.bin_width,
+                self.min_mag + nonzero[-1] * self.bin_width)
@@ -141,6 +141,15 @@ class TruncatedGRMFD(BaseMFD):
         min_mag, num_bins = self._get_min_mag_and_num_bins()
         return min_mag
 
+    def get_min_max_mag(self):
+        """
+        Return the first and the last bin centers of the histogram.
+
+        See :meth:`_get_min_mag_and_num_bins`.
+        """
+        min_mag, num_bins = self._get_min_mag_and_num_bins()
+        return min_mag, min_mag + (num_bins - 1) * self.bin_width
+
     def get_annual_occurrence_rates(self):
         """
         Calculate and return the annual occurrence rates histogram.
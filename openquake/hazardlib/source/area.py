@@ -16,7 +16,6 @@
 """
 Module :mod:`openquake.hazardlib.source.area` defines :class:`AreaSource`.
 """
-from openquake.hazardlib.geo import Point
 from openquake.hazardlib.source.point import PointSource
 from openquake.hazardlib.source.rupture import ProbabilisticRupture
 
@@ -36,6 +35,8 @@ class AreaSource(PointSource):
     Other parameters (except ``location``) are the same as for
     :class:`~openquake.hazardlib.source.point.PointSource`.
     """
+    __slots__ = ('polygon', 'area_discretization')
+
     def __init__(self, source_id, name, tectonic_region_type,
                  mfd, rupture_mesh_spacing,
                  magnitude_scaling_relationship, rupture_aspect_ratio,
@@ -95,33 +96,25 @@ class AreaSource(PointSource):
         # generate "reference ruptures" -- all the ruptures that have the same
         # epicenter location (first point of the polygon's mesh) but different
         # magnitudes, nodal planes, hypocenters' depths and occurrence rates
-        ref_ruptures = []
-        for (mag, mag_occ_rate) in self.get_annual_occurrence_rates():
-            for (np_prob, np) in self.nodal_plane_distribution.data:
-                for (hc_prob, hc_depth) in self.hypocenter_distribution.data:
-                    hypocenter = Point(latitude=epicenter0.latitude,
-                                       longitude=epicenter0.longitude,
-                                       depth=hc_depth)
-                    occurrence_rate = (mag_occ_rate
-                                       * float(np_prob) * float(hc_prob))
-                    occurrence_rate *= rate_scaling_factor
-                    surface = self._get_rupture_surface(mag, np, hypocenter)
-                    ref_ruptures.append((mag, np.rake, hc_depth,
-                                         surface, occurrence_rate))
+        ref_ruptures = list(self._iter_ruptures_at_location(
+            temporal_occurrence_model, epicenter0, rate_scaling_factor
+        ))
 
         # for each of the epicenter positions generate as many ruptures
         # as we generated "reference" ones: new ruptures differ only
         # in hypocenter and surface location
         for epicenter in polygon_mesh:
-            for mag, rake, hc_depth, surface, occ_rate in ref_ruptures:
+            for ref_rupture in ref_ruptures:
                 # translate the surface from first epicenter position
                 # to the target one preserving it's geometry
-                surface = surface.translate(epicenter0, epicenter)
+                surface = ref_rupture.surface.translate(epicenter0, epicenter)
                 hypocenter = epicenter
-                hypocenter.depth = hc_depth
+                hypocenter.depth = ref_rupture.hypocenter.depth
                 rupture = ProbabilisticRupture(
-                    mag, rake, self.tectonic_region_type, hypocenter,
-                    surface, type(self), occ_rate, temporal_occurrence_model
+                    ref_rupture.mag, ref_rupture.rake,
+                    self.tectonic_region_type, hypocenter, surface,
+                    type(self), ref_rupture.occurrence_rate,
+                    temporal_occurrence_model
                 )
                 yield rupture
 
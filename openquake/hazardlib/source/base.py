@@ -57,6 +57,9 @@ class SeismicSource(object):
         (if not None).
     """
     __metaclass__ = abc.ABCMeta
+    __slots__ = ('source_id', 'name', 'tectonic_region_type', 'mfd',
+                 'rupture_mesh_spacing', 'magnitude_scaling_relationship',
+                 'rupture_aspect_ratio')
 
     def __init__(self, source_id, name, tectonic_region_type,
                  mfd, rupture_mesh_spacing,
@@ -76,6 +79,28 @@ class SeismicSource(object):
         self.magnitude_scaling_relationship = magnitude_scaling_relationship
         self.rupture_aspect_ratio = rupture_aspect_ratio
 
+    def __getstate__(self):
+        """
+        Implemented to provide information for pickling.
+
+        :returns:
+            A `dict` with values of all the slots defined by source's class
+            and its base classes (plus instance dictionary items, if any).
+        """
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Set state when creating a source from pickled data.
+        """
+        for key, value in state.iteritems():
+            setattr(self, key, value)
+
     @abc.abstractmethod
     def get_rupture_enclosing_polygon(self, dilation=0):
         """
@@ -44,6 +44,8 @@ class ComplexFaultSource(SeismicSource):
         If :meth:`~openquake.hazardlib.geo.surface.complex_fault.ComplexFaultSurface.check_fault_data`
         fails or if rake value is invalid.
     """
+    __slots__ = ('edges', 'rake')
+
     def __init__(self, source_id, name, tectonic_region_type,
                  mfd, rupture_mesh_spacing,
                  magnitude_scaling_relationship, rupture_aspect_ratio,
@@ -117,6 +119,31 @@ class ComplexFaultSource(SeismicSource):
                 )
 
 
+def _closest_index(values, target):
+    """
+    Find the index of the item of ``values`` closest to ``target``.
+
+    The result is the same as of ``numpy.argmin(numpy.abs(values - target))``
+    (including picking the first one of equally close items), but it is
+    found with a binary search.
+
+    :param values:
+        1d numpy array sorted in ascending order, like accumulated cells'
+        lengths or areas.
+    :param target:
+        The value to look for.
+    :returns:
+        Index of the closest item.
+    """
+    idx = values.searchsorted(target)
+    if idx and (idx == len(values)
+                or target - values[idx - 1] <= values[idx] - target):
+        # the closest item is the one before the insertion point.
+        # move to the first item with that value, like argmin does
+        idx = values.searchsorted(values[idx - 1])
+    return idx
+
+
 def _float_ruptures(rupture_area, rupture_length, cell_area, cell_length):
     """
     Get all possible unique rupture placements on the fault surface.
@@ -160,7 +187,7 @@ def _float_ruptures(rupture_area, rupture_length, cell_area, cell_length):
             # length (note that we only consider top row here, mainly
             # for simplicity: it's not yet clear how many rows will we
             # end up with).
-            rup_cols = numpy.argmin(numpy.abs(lengths_acc - rupture_length))
+            rup_cols = _closest_index(lengths_acc, rupture_length)
             last_col = rup_cols + col + 1
             if last_col == ncols and lengths_acc[rup_cols] < rupture_length:
                 # rupture doesn't fit along length (the requested rupture
@@ -176,7 +203,7 @@ def _float_ruptures(rupture_area, rupture_length, cell_area, cell_length):
             # to requested area) number of rows.
             areas_acc = numpy.sum(cell_area[row:, col:last_col], axis=1)
             areas_acc = numpy.add.accumulate(areas_acc, axis=0)
-            rup_rows = numpy.argmin(numpy.abs(areas_acc - rupture_area))
+            rup_rows = _closest_index(areas_acc, rupture_area)
             last_row = rup_rows + row + 1
             if last_row == nrows and areas_acc[rup_rows] < rupture_area:
                 # rupture doesn't fit along width.
@@ -190,8 +217,7 @@ def _float_ruptures(rupture_area, rupture_length, cell_area, cell_length):
                         # try to extend along length
                         areas_acc = numpy.sum(cell_area[:, col:], axis=0)
                         areas_acc = numpy.add.accumulate(areas_acc, axis=0)
-                        rup_cols = numpy.argmin(numpy.abs(areas_acc
-                                                          - rupture_area))
+                        rup_cols = _closest_index(areas_acc, rupture_area)
                         last_col = rup_cols + col + 1
                         if last_col == ncols \
                                 and areas_acc[rup_cols] < rupture_area:
@@ -18,6 +18,8 @@ Module :mod:`openquake.hazardlib.source.point` defines :class:`PointSource`.
 """
 import math
 
+import numpy
+
 from openquake.hazardlib.geo import Point
 from openquake.hazardlib.geo.surface.planar import PlanarSurface
 from openquake.hazardlib.source.base import SeismicSource
@@ -56,6 +58,10 @@ class PointSource(SeismicSource):
         depth,  if one or more of hypocenter depth values is shallower
         than upper seismogenic depth or deeper than lower seismogenic depth.
     """
+    __slots__ = ('location', 'nodal_plane_distribution',
+                 'hypocenter_distribution', 'upper_seismogenic_depth',
+                 'lower_seismogenic_depth')
+
     def __init__(self, source_id, name, tectonic_region_type,
                  mfd, rupture_mesh_spacing,
                  magnitude_scaling_relationship, rupture_aspect_ratio,
@@ -93,8 +99,9 @@ class PointSource(SeismicSource):
         :returns:
             Half of maximum rupture's diagonal surface projection.
         """
-        # extract maximum magnitude
-        max_mag, _rate = self.get_annual_occurrence_rates()[-1]
+        # extract maximum magnitude (the one of the last bin with non-zero
+        # rate) without computing the whole histogram
+        _min_mag, max_mag = self.mfd.get_min_max_mag()
         max_radius = 0.0
         for (np_prob, np) in self.nodal_plane_distribution.data:
             # compute rupture dimensions
@@ -102,7 +109,7 @@ class PointSource(SeismicSource):
             # compute rupture width surface projection
             rup_width = rup_width * math.cos(math.radians(np.dip))
             # the projection radius is half of the rupture diagonal
-            radius = math.sqrt(rup_length ** 2 + rup_width ** 2) / 2.0
+            radius = math.hypot(rup_length, rup_width) / 2.0
             if radius > max_radius:
                 max_radius = radius
         return max_radius
@@ -142,7 +149,7 @@ class PointSource(SeismicSource):
         """
         rup_length, rup_width = rupture.surface.length, rupture.surface.width
         rup_width = rup_width * math.cos(math.radians(rupture.surface.dip))
-        radius = math.sqrt(rup_length ** 2 + rup_width ** 2) / 2.0
+        radius = math.hypot(rup_length, rup_width) / 2.0
         radius += integration_distance
         epicenter = Point(rupture.hypocenter.longitude,
                           rupture.hypocenter.latitude)
@@ -180,20 +187,38 @@ class PointSource(SeismicSource):
             (``rate_scaling_factor = 1``).
         """
         assert 0 < rate_scaling_factor
-        for (mag, mag_occ_rate) in self.get_annual_occurrence_rates():
-            for (np_prob, np) in self.nodal_plane_distribution.data:
-                for (hc_prob, hc_depth) in self.hypocenter_distribution.data:
+        mag_rates = self.get_annual_occurrence_rates()
+        nodal_planes = self.nodal_plane_distribution.data
+        hypocenters = self.hypocenter_distribution.data
+
+        # calculate occurrence rates for all the combinations of magnitude,
+        # nodal plane and hypocenter depth at once. the resulting nested
+        # list is indexed by magnitude, nodal plane and hypocenter indices
+        mag_occ_rates = numpy.array([rate for (mag, rate) in mag_rates],
+                                    dtype=float)
+        np_probs = numpy.array([float(prob) for (prob, np) in nodal_planes])
+        hc_probs = numpy.array([float(prob) for (prob, hc) in hypocenters])
+        occurrence_rates = (mag_occ_rates[:, None, None]
+                            * np_probs[None, :, None]
+                            * hc_probs[None, None, :])
+        occurrence_rates *= rate_scaling_factor
+        occurrence_rates = occurrence_rates.tolist()
+
+        for i, (mag, _mag_occ_rate) in enumerate(mag_rates):
+            for j, (_np_prob, np) in enumerate(nodal_planes):
+                # rupture dimensions don't depend on hypocenter depth
+                rup_length, rup_width = self._get_rupture_dimensions(mag, np)
+                for k, (_hc_prob, hc_depth) in enumerate(hypocenters):
                     hypocenter = Point(latitude=location.latitude,
                                        longitude=location.longitude,
                                        depth=hc_depth)
-                    occurrence_rate = (mag_occ_rate
-                                       * float(np_prob) * float(hc_prob))
-                    occurrence_rate *= rate_scaling_factor
-                    surface = self._get_rupture_surface(mag, np, hypocenter)
+                    surface = self._get_rupture_surface(
+                        np, hypocenter, rup_length, rup_width
+                    )
                     yield ProbabilisticRupture(
                         mag, np.rake, self.tectonic_region_type, hypocenter,
                         surface, type(self),
-                        occurrence_rate, temporal_occurrence_model
+                        occurrence_rates[i][j][k], temporal_occurrence_model
                     )
 
     def _get_rupture_dimensions(self, mag, nodal_plane):
@@ -234,18 +259,23 @@ class PointSource(SeismicSource):
             rup_length = area / rup_width
         return rup_length, rup_width
 
-    def _get_rupture_surface(self, mag, nodal_plane, hypocenter):
+    def _get_rupture_surface(self, nodal_plane, hypocenter,
+                             rup_length, rup_width):
         """
         Create and return rupture surface object with given properties.
 
-        :param mag:
-            Magnitude value, used to calculate rupture dimensions,
-            see :meth:`_get_rupture_dimensions`.
         :param nodal_plane:
             Instance of :class:`openquake.hazardlib.geo.nodalplane.NodalPlane`
             describing the rupture orientation.
         :param hypocenter:
             Point representing rupture's hypocenter.
+        :param rup_length:
+            Rupture length in km.
+        :param rup_width:
+            Rupture width in km. Rupture dimensions are supposed to be
+            calculated by :meth:`_get_rupture_dimensions` for the same
+            nodal plane. They don't depend on the hypocenter, so callers
+            can calculate them once for all the hypocenter depths.
         :returns:
             Instance of :class:`~openquake.hazardlib.geo.surface.planar.PlanarSurface`.
         """
@@ -261,7 +291,6 @@ class PointSource(SeismicSource):
         azimuth_left = (azimuth_down + 90) % 360
         azimuth_up = (azimuth_left + 90) % 360
 
-        rup_length, rup_width = self._get_rupture_dimensions(mag, nodal_plane)
         # calculate the height of the rupture being projected
         # on the vertical plane:
         rup_proj_height = rup_width * math.sin(rdip)
@@ -302,31 +331,28 @@ class PointSource(SeismicSource):
             )
 
         # now we can find four corner points of the rupture rectangle.
-        # we find the point that is on the same depth than the rupture
-        # center but lies on the right border of its surface:
-        right_center = rupture_center.point_at(
-            horizontal_distance=rup_length / 2.0,
-            vertical_increment=0, azimuth=azimuth_right
+        # all of them lie at the same horizontal distance from the rupture
+        # center -- half of the rupture surface projection's diagonal --
+        # and directions to them deviate from the strike direction (for the
+        # right corners) or from the opposite one (for the left corners)
+        # by the same angle. so each corner can be found by moving from
+        # the rupture center just once. the top and the bottom edges are
+        # half of the rupture projection height shallower and deeper than
+        # the rupture center respectively.
+        hdist = math.hypot(rup_length, rup_proj_width) / 2.0
+        theta = math.degrees(math.atan2(rup_proj_width, rup_length))
+        right_top = rupture_center.point_at(
+            hdist, -hheight, (azimuth_right - theta) % 360
+        )
+        right_bottom = rupture_center.point_at(
+            hdist, hheight, (azimuth_right + theta) % 360
+        )
+        left_bottom = rupture_center.point_at(
+            hdist, hheight, (azimuth_left - theta) % 360
         )
-        # than we get the right bottom corner:
-        right_bottom = right_center.point_at(
-            horizontal_distance=rup_proj_width / 2.0,
-            vertical_increment=rup_proj_height / 2.0,
-            azimuth=azimuth_down
+        left_top = rupture_center.point_at(
+            hdist, -hheight, (azimuth_left + theta) % 360
         )
-        # and other three points can be easily found by stepping from
-        # already known points horizontally only by rupture length
-        # (to get to left point from right one) or horizontally and
-        # vertically (to get to top edge from bottom).
-        right_top = right_bottom.point_at(horizontal_distance=rup_proj_width,
-                                          vertical_increment=-rup_proj_height,
-                                          azimuth=azimuth_up)
-        left_top = right_top.point_at(horizontal_distance=rup_length,
-                                      vertical_increment=0,
-                                      azimuth=azimuth_left)
-        left_bottom = right_bottom.point_at(horizontal_distance=rup_length,
-                                            vertical_increment=0,
-                                            azimuth=azimuth_left)
 
         return PlanarSurface(self.rupture_mesh_spacing, nodal_plane.strike,
                              nodal_plane.dip, left_top, right_top,
@@ -232,6 +232,19 @@ class MeshGetMinDistanceTestCase(unittest.TestCase):
                    expected_distance_indices=[3, 3, 3, 0, 0, 3, 3, 3, 3])
 
 
+class MeshTrigCacheTestCase(unittest.TestCase):
+    def test(self):
+        mesh = Mesh(numpy.array([[0., 90.], [-45., 180.]]),
+                    numpy.array([[0., 30.], [60., -90.]]), None)
+        lons, lats, cos_lats = mesh._get_trig_cache()
+        aaae = numpy.testing.assert_array_almost_equal
+        aaae(lons, [[0, math.pi / 2], [-math.pi / 4, math.pi]])
+        aaae(lats, [[0, math.pi / 6], [math.pi / 3, -math.pi / 2]])
+        aaae(cos_lats, [[1, 3 ** 0.5 / 2], [0.5, 0]])
+        # values are calculated only once
+        self.assertIs(mesh._get_trig_cache()[0], lons)
+
+
 class MeshGetDistanceMatrixTestCase(unittest.TestCase):
     def test_zeroes(self):
         mesh = Mesh(numpy.zeros(1000), numpy.zeros(1000), None)
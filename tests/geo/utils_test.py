@@ -34,6 +34,16 @@ class CleanPointTestCase(unittest.TestCase):
         a, b, c = geo.Point(1e-4, 1e-4), geo.Point(0, 0), geo.Point(1e-6, 1e-6)
         self.assertEqual(utils.clean_points([a, b, c]), [a, b])
 
+    def test_close_duplicates_chain(self):
+        # each point is close to the previous one, but the third one
+        # is not close to the first one
+        a, b, c = geo.Point(0, 0), geo.Point(0, 7e-6), geo.Point(0, 1.4e-5)
+        self.assertEqual(utils.clean_points([a, b, c]), [a, c])
+
+    def test_no_duplicates(self):
+        a, b, c = geo.Point(1, 2, 3), geo.Point(3, 4, 5), geo.Point(5, 6, 7)
+        self.assertEqual(utils.clean_points([a, b, c, a]), [a, b, c, a])
+
 
 class LineIntersectsItselfTestCase(unittest.TestCase):
     def __init__(self, *args, **kwargs):
@@ -96,6 +106,18 @@ class GetLongitudinalExtentTestCase(unittest.TestCase):
         self.assertEqual(utils.get_longitudinal_extent(95, -180 + 94), 179)
         self.assertEqual(utils.get_longitudinal_extent(95, -180 + 96), -179)
 
+    def test_arrays(self):
+        lons1 = numpy.array([10, -120, 20, -178.3, 177.7])
+        lons2 = numpy.array([20, 30, 10, 177.7, -178.3])
+        numpy.testing.assert_allclose(
+            utils.get_longitudinal_extent(lons1, lons2),
+            [10, 150, -10, -4, 4]
+        )
+        numpy.testing.assert_allclose(
+            utils.get_longitudinal_extent(95, lons2),
+            [-75, -65, -85, 82.7, 86.7]
+        )
+
 
 class GetSphericalBoundingBox(unittest.TestCase):
     def __init__(self, *args, **kwargs):
@@ -60,3 +60,12 @@ class BaseMFDModificationsTestCase(BaseMFDTestCase):
         mfd.modify('foo', dict(a=1, b='2', c=True))
         self.assertEqual(mfd.foo_calls, [{'a': 1, 'b': '2', 'c': True}])
         self.assertEqual(mfd.check_constraints_call_count, 1)
+
+
+class BaseMFDGetMinMaxMagTestCase(BaseMFDTestCase):
+    def test_default_implementation(self):
+        class TestMFD(self.BaseTestMFD):
+            def get_annual_occurrence_rates(self):
+                return [(3.5, 0), (4.5, 1), (5.5, 0.1), (6.5, 0)]
+
+        self.assertEqual(TestMFD().get_min_max_mag(), (4.5, 5.5))
@@ -63,6 +63,7 @@ class EvenlyDiscretizedMFDTestCase(BaseMFDTestCase):
                                    occurrence_rates=[1])
         self.assertEqual(mfd.get_annual_occurrence_rates(), [(0, 1)])
         self.assertEqual(mfd.get_min_mag(), 0)
+        self.assertEqual(mfd.get_min_max_mag(), (0, 0))
 
     def test_zero_rate(self):
         evenly_discretized = EvenlyDiscretizedMFD(
@@ -70,6 +71,14 @@ class EvenlyDiscretizedMFDTestCase(BaseMFDTestCase):
         )
         self.assertEqual(evenly_discretized.get_annual_occurrence_rates(),
                          [(1, 4), (3, 0), (5, 5)])
+        self.assertEqual(evenly_discretized.get_min_max_mag(), (1, 5))
+
+    def test_zero_rate_first_and_last_bins(self):
+        evenly_discretized = EvenlyDiscretizedMFD(
+            min_mag=1, bin_width=2, occurrence_rates=[0, 4, 0, 5, 0]
+        )
+        # bins with zero rate at the edges of the histogram are skipped
+        self.assertEqual(evenly_discretized.get_min_max_mag(), (3, 7))
 
     def test(self):
         evenly_discretized = EvenlyDiscretizedMFD(
@@ -78,3 +87,4 @@ class EvenlyDiscretizedMFDTestCase(BaseMFDTestCase):
         self.assertEqual(evenly_discretized.get_annual_occurrence_rates(),
                          [(0.2, 2.1), (0.5, 2.4), (0.8, 5.3)])
         self.assertEqual(evenly_discretized.get_min_mag(), 0.2)
+        self.assertEqual(evenly_discretized.get_min_max_mag(), (0.2, 0.8))
@@ -81,6 +81,9 @@ class TruncatedGRMFDMFDGetRatesTestCase(BaseMFDTestCase):
             self.assertAlmostEqual(rate, expected_rate, delta=rate_tolerance)
             if i == 0:
                 self.assertEqual(mag, mfd.get_min_mag())
+        min_mag, max_mag = mfd.get_min_max_mag()
+        self.assertEqual(min_mag, mfd.get_min_mag())
+        self.assertAlmostEqual(max_mag, actual_rates[-1][0], delta=1e-14)
 
     def test_1_different_min_mag_and_max_mag(self):
         expected_rates = [
@@ -167,6 +167,9 @@ class YoungsCoppersmith1985MFDConstraintsTestCase(BaseMFDTestCase):
         numpy.testing.assert_allclose(computed_rates, expected_rates)
 
         self.assertEqual(5.05, mfd.get_min_mag())
+        min_mag, max_mag = mfd.get_min_max_mag()
+        self.assertEqual(5.05, min_mag)
+        self.assertAlmostEqual(6.95, max_mag)
 
     def test_from_characteristic_rate(self):
         mfd = YoungsCoppersmith1985MFD.from_characteristic_rate(
@@ -197,3 +200,6 @@ class YoungsCoppersmith1985MFDConstraintsTestCase(BaseMFDTestCase):
         numpy.testing.assert_allclose(computed_rates, expected_rates)
 
         self.assertEqual(5.05, mfd.get_min_mag())
+        min_mag, max_mag = mfd.get_min_max_mag()
+        self.assertEqual(5.05, min_mag)
+        self.assertAlmostEqual(6.95, max_mag)
@@ -13,15 +13,16 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import math
 import unittest
 
 import numpy
 
 from openquake.hazardlib.source.complex_fault import (ComplexFaultSource,
-                                                      _float_ruptures)
-from openquake.hazardlib.geo import Line, Point
+                                                      _float_ruptures,
+                                                      _closest_index)
+from openquake.hazardlib.geo import Line, Point, geodetic
 from openquake.hazardlib.geo.surface.simple_fault import SimpleFaultSurface
-from openquake.hazardlib.scalerel.peer import PeerMSR
 
 from tests.source import simple_fault_test
 from tests.source import _complex_fault_test_data as test_data
@@ -56,7 +57,7 @@ class ComplexFaultSourceIterRupturesTestCase(
         source_id = name = 'test-source'
         trt = self.TRT
         rake = self.RAKE
-        magnitude_scaling_relationship = PeerMSR()
+        magnitude_scaling_relationship = self.MSR
         rupture_aspect_ratio = aspect_ratio
         edges = [Line([Point(*coords) for coords in edge])
                  for edge in edges]
@@ -246,19 +247,24 @@ class ComplexFaultSourceRupEnclPolyTestCase(
         vdist_top = sf.upper_seismogenic_depth
         vdist_bottom = sf.lower_seismogenic_depth
 
-        hdist_top = vdist_top / numpy.tan(numpy.radians(dip))
-        hdist_bottom = vdist_bottom / numpy.tan(numpy.radians(dip))
+        tan_dip = math.tan(math.radians(dip))
+        hdist_top = vdist_top / tan_dip
+        hdist_bottom = vdist_bottom / tan_dip
 
         strike = fault_trace[0].azimuth(fault_trace[-1])
         azimuth = (strike + 90.0) % 360
 
-        top_edge = []
-        bottom_edge = []
-        for point in fault_trace.points:
-            top_edge.append(point.point_at(hdist_top, vdist_top, azimuth))
-            bottom_edge.append(point.point_at(hdist_bottom, vdist_bottom,
-                                              azimuth))
-        edges = [Line(top_edge), Line(bottom_edge)]
+        # move all the fault trace points at once
+        lons = numpy.array([point.longitude for point in fault_trace.points])
+        lats = numpy.array([point.latitude for point in fault_trace.points])
+        depths = numpy.array([point.depth for point in fault_trace.points])
+        edges = []
+        for hdist, vdist in [(hdist_top, vdist_top),
+                             (hdist_bottom, vdist_bottom)]:
+            edge_lons, edge_lats = geodetic.point_at(lons, lats,
+                                                     azimuth, hdist)
+            edges.append(Line([Point(lon, lat, depth) for lon, lat, depth
+                               in zip(edge_lons, edge_lats, depths + vdist)]))
 
         return ComplexFaultSource(
             sf.source_id, sf.name, sf.tectonic_region_type,
@@ -316,11 +322,38 @@ class FloatRupturesTestCase(unittest.TestCase):
 
         slices = _float_ruptures(rupture_area, rupture_length,
                                  cell_area, cell_length)
-        self.assertEqual(len(slices), 6)
-        tl, tm, tr, bl, bm, br = slices
-        self.assertEqual(tl, (slice(0, 3), slice(0, 2)))
-        self.assertEqual(tm, (slice(0, 4), slice(1, 3)))
-        self.assertEqual(tr, (slice(0, 3), slice(2, 4)))
-        self.assertEqual(bl, (slice(1, 4), slice(0, 2)))
-        self.assertEqual(bm, (slice(1, 4), slice(1, 3)))
-        self.assertEqual(br, (slice(1, 4), slice(2, 4)))
+        # top left, top middle, top right, bottom left, bottom middle
+        # and bottom right ruptures, as (row start, row stop, column start,
+        # column stop) tuples
+        self.assertEqual([(rows.start, rows.stop, cols.start, cols.stop)
+                          for rows, cols in slices],
+                         [(0, 3, 0, 2), (0, 4, 1, 3), (0, 3, 2, 4),
+                          (1, 4, 0, 2), (1, 4, 1, 3), (1, 4, 2, 4)])
+
+
+class ClosestIndexTestCase(unittest.TestCase):
+    def _test(self, values, target):
+        values = numpy.array(values, dtype=float)
+        expected = numpy.argmin(numpy.abs(values - target))
+        self.assertEqual(_closest_index(values, target), expected)
+
+    def test_inside(self):
+        self._test([1, 2, 3, 4], 2.4)
+        self._test([1, 2, 3, 4], 2.6)
+        self._test([1, 2, 3, 4], 3)
+
+    def test_outside(self):
+        self._test([1, 2, 3, 4], 0.5)
+        self._test([1, 2, 3, 4], 5)
+
+    def test_ties(self):
+        self._test([1, 2, 3, 4], 2.5)
+        self._test([1, 2, 2, 2, 3], 2.4)
+        self._test([1, 2, 2, 2, 3], 2.5)
+        self._test([1, 2, 2, 2, 3], 2)
+        self._test([1, 1, 1, 2], 0)
+        self._test([1, 2, 2, 2], 3)
+
+    def test_single_value(self):
+        self._test([2], 1)
+        self._test([2], 3)
@@ -13,6 +13,7 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import pickle
 import unittest
 from decimal import Decimal
 
@@ -110,6 +111,31 @@ class PointSourceCreationTestCase(unittest.TestCase):
         self.make_point_source()
 
 
+class PointSourcePickleTestCase(unittest.TestCase):
+    def test_no_instance_dict(self):
+        source = make_point_source()
+        self.assertFalse(hasattr(source, '__dict__'))
+        with self.assertRaises(AttributeError):
+            source.foo = 'bar'
+
+    def test_pickle(self):
+        source = make_point_source()
+        # point sources can't be pickled with protocols 0 and 1 because
+        # of slotted PMF objects, see SimpleFaultPickleTestCase for those
+        source2 = pickle.loads(pickle.dumps(source, pickle.HIGHEST_PROTOCOL))
+        self.assertIsInstance(source2, PointSource)
+        self.assertEqual(sorted(source2.__getstate__()),
+                         sorted(source.__getstate__()))
+        self.assertEqual(source2.source_id, source.source_id)
+        self.assertEqual(source2.location, source.location)
+        self.assertEqual(source2.lower_seismogenic_depth,
+                         source.lower_seismogenic_depth)
+        ruptures = list(source.iter_ruptures(PoissonTOM(50)))
+        ruptures2 = list(source2.iter_ruptures(PoissonTOM(50)))
+        self.assertEqual([(rup.mag, rup.occurrence_rate) for rup in ruptures2],
+                         [(rup.mag, rup.occurrence_rate) for rup in ruptures])
+
+
 class PointSourceIterRupturesTestCase(unittest.TestCase):
     def _get_rupture(self, min_mag, max_mag, hypocenter_depth,
                      aspect_ratio, dip, rupture_mesh_spacing,
@@ -373,6 +399,63 @@ class PointSourceIterRupturesTestCase(unittest.TestCase):
                                     lower_seismogenic_depth=150)
         self.assertEqual(rupture.mag, 9.5)
 
+    def test_off_equator_large_magnitude(self):
+        # far from the equator and for large ruptures the corners must
+        # still be symmetric about the rupture center, and rupture edges
+        # must have the requested length and width
+        nodal_plane = NodalPlane(strike=30, dip=50, rake=90)
+        mfd = EvenlyDiscretizedMFD(min_mag=8, bin_width=1,
+                                   occurrence_rates=[1])
+        point_source = make_point_source(
+            mfd=mfd, location=Point(10, 60), rupture_aspect_ratio=1.5,
+            nodal_plane_distribution=PMF([(1, nodal_plane)]),
+            hypocenter_distribution=PMF([(1, 40)]),
+            upper_seismogenic_depth=0, lower_seismogenic_depth=100
+        )
+        [rupture] = list(point_source.iter_ruptures(PoissonTOM(50)))
+        surface = rupture.surface
+        # the rupture fits the seismogenic layer, so its center
+        # is the hypocenter
+        center = rupture.hypocenter
+        self.assertEqual(center, Point(10, 60, 40))
+        length, width = point_source._get_rupture_dimensions(8, nodal_plane)
+        proj_width = width * numpy.cos(numpy.radians(nodal_plane.dip))
+        half_height = width * numpy.sin(numpy.radians(nodal_plane.dip)) / 2
+
+        # all the corners are at the same horizontal distance from
+        # the center, top ones are above and bottom ones are below it
+        corners = [surface.top_left, surface.top_right,
+                   surface.bottom_left, surface.bottom_right]
+        for corner in corners:
+            horizontal_distance = Point(center.longitude, center.latitude) \
+                .distance(Point(corner.longitude, corner.latitude))
+            self.assertAlmostEqual(horizontal_distance,
+                                   numpy.hypot(length, proj_width) / 2)
+        for corner in corners[:2]:
+            self.assertAlmostEqual(corner.depth, 40 - half_height)
+        for corner in corners[2:]:
+            self.assertAlmostEqual(corner.depth, 40 + half_height)
+        # opposite corners lie on the same great circle through the center
+        for corner1, corner2 in [(surface.top_left, surface.bottom_right),
+                                 (surface.top_right, surface.bottom_left)]:
+            azimuth_diff = center.azimuth(corner1) - center.azimuth(corner2)
+            self.assertAlmostEqual(azimuth_diff % 360, 180)
+
+        self.assertAlmostEqual(
+            surface.top_left.distance(surface.top_right), length, delta=1e-3
+        )
+        self.assertAlmostEqual(
+            surface.bottom_left.distance(surface.bottom_right), length,
+            delta=1e-3
+        )
+        self.assertAlmostEqual(
+            surface.top_left.distance(surface.bottom_left), width, delta=1e-3
+        )
+        self.assertAlmostEqual(
+            surface.top_right.distance(surface.bottom_right), width,
+            delta=1e-3
+        )
+
 
 class PointSourceMaxRupProjRadiusTestCase(unittest.TestCase):
     def test(self):
@@ -392,6 +475,18 @@ class PointSourceMaxRupProjRadiusTestCase(unittest.TestCase):
         radius = source._get_max_rupture_projection_radius()
         self.assertAlmostEqual(radius, 3.8712214)
 
+    def test_zero_rate_top_bins(self):
+        # top bins of the mfd having zero rate produce no ruptures,
+        # so they don't affect the radius
+        def get_radius(occurrence_rates):
+            mfd = EvenlyDiscretizedMFD(min_mag=5, bin_width=1,
+                                       occurrence_rates=occurrence_rates)
+            source = make_point_source(mfd=mfd)
+            return source._get_max_rupture_projection_radius()
+
+        self.assertEqual(get_radius([1, 0, 0]), get_radius([1]))
+        self.assertLess(get_radius([1, 0, 0]), get_radius([1, 1, 1]))
+
 
 class PointSourceRupEncPolygon(unittest.TestCase):
     def test_no_dilation(self):
@@ -13,6 +13,7 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import pickle
 import unittest
 
 import numpy
@@ -33,6 +34,8 @@ from tests.source import _simple_fault_test_data as test_data
 class _BaseFaultSourceTestCase(unittest.TestCase):
     TRT = TRT.ACTIVE_SHALLOW_CRUST
     RAKE = 0
+    # scaling relationships are stateless, share one between tests
+    MSR = PeerMSR()
 
     def _make_source(self, mfd, aspect_ratio, fault_trace=None, dip=45):
         source_id = name = 'test-source'
@@ -41,7 +44,7 @@ class _BaseFaultSourceTestCase(unittest.TestCase):
         rupture_mesh_spacing = 1
         upper_seismogenic_depth = 0
         lower_seismogenic_depth = 4.2426406871192848
-        magnitude_scaling_relationship = PeerMSR()
+        magnitude_scaling_relationship = self.MSR
         rupture_aspect_ratio = aspect_ratio
         if fault_trace is None:
             fault_trace = Line([Point(0.0, 0.0),
@@ -162,6 +165,35 @@ class SimpleFaultParametersChecksTestCase(_BaseFaultSourceTestCase):
         self.assertEqual(str(ar.exception), 'fault trace intersects itself')
 
 
+class SimpleFaultPickleTestCase(_BaseFaultSourceTestCase):
+    def test_pickle(self):
+        mfd = TruncatedGRMFD(a_val=0.5, b_val=1.0, min_mag=3.0, max_mag=4.0,
+                             bin_width=1.0)
+        source = self._make_source(mfd=mfd, aspect_ratio=1.0)
+        tom = PoissonTOM(time_span=50)
+        ruptures = list(source.iter_ruptures(tom))
+        # protocols 0 and 1 can pickle slotted objects only because
+        # seismic sources define __getstate__ and __setstate__
+        for protocol in (0, 1, pickle.HIGHEST_PROTOCOL):
+            source2 = pickle.loads(pickle.dumps(source, protocol))
+            self.assertIsInstance(source2, SimpleFaultSource)
+            self.assertEqual(sorted(source2.__getstate__()),
+                             sorted(source.__getstate__()))
+            self.assertEqual(source2.source_id, source.source_id)
+            self.assertEqual(source2.fault_trace, source.fault_trace)
+            self.assertEqual(source2.dip, source.dip)
+            ruptures2 = list(source2.iter_ruptures(tom))
+            self.assertEqual(len(ruptures2), len(ruptures))
+            for rupture, rupture2 in zip(ruptures, ruptures2):
+                self.assertEqual(rupture2.mag, rupture.mag)
+                self.assertEqual(rupture2.occurrence_rate,
+                                 rupture.occurrence_rate)
+                mesh, mesh2 = rupture.surface.mesh, rupture2.surface.mesh
+                numpy.testing.assert_array_equal(mesh2.lons, mesh.lons)
+                numpy.testing.assert_array_equal(mesh2.lats, mesh.lats)
+                numpy.testing.assert_array_equal(mesh2.depths, mesh.depths)
+
+
 class SimpleFaultRupEncPolyTestCase(_BaseFaultSourceTestCase):
     mfd = TruncatedGRMFD(a_val=0.5, b_val=1.0, min_mag=10, max_mag=20,
                          bin_width=1.0)